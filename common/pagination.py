@@ -0,0 +1,11 @@
+# common/pagination.py
+from rest_framework.pagination import PageNumberPagination
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Page-number pagination with a bounded, client-adjustable page size.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
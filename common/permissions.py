@@ -1,12 +1,21 @@
 # common/permissions.py
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 from users.models import UserChoice
+
+# Methods a client may issue against an owned object; ownership is enforced
+# by the object-level check.
+_WRITE_METHODS = frozenset({'PATCH', 'PUT', 'DELETE'})
+
+_MANAGER = UserChoice.MANAGER
+_CLIENT = UserChoice.CLIENT
+
+
 class IsManager(BasePermission):
     """
     Allows access only to users with the MANAGER role.
     """
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == UserChoice.MANAGER
+        return request.user.is_authenticated and request.user.role == _MANAGER
 
 class IsClient(BasePermission):
     """
@@ -15,18 +24,15 @@ class IsClient(BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        if request.user.role == UserChoice.CLIENT:
-            return True
-        if request.user.role == UserChoice.MANAGER and request.method in SAFE_METHODS:
-            return True
-        return False
+        role = request.user.role
+        return role == _CLIENT or (role == _MANAGER and request.method in SAFE_METHODS)
 
 class IsOwnerOrManager(BasePermission):
     """
     Allows access to owners of the object or managers.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user.role == UserChoice.MANAGER:
+        if request.user.role == _MANAGER:
             return True
         return obj.user == request.user
 
@@ -37,89 +43,57 @@ class IsAuthenticatedClientOrManager(BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        if request.user.role == UserChoice.MANAGER:
-            return True
-        if request.user.role == UserChoice.CLIENT and request.method in SAFE_METHODS:
-            return True
-        return False
+        role = request.user.role
+        return role == _MANAGER or (role == _CLIENT and request.method in SAFE_METHODS)
 
 
-class IsRentalOwnerOrManager(BasePermission):
+def _make_owner_permission(owner_attr, name, doc):
     """
-    Custom permission for RentalModel.
+    Build an owner-or-manager permission class for models whose owner is
+    stored in the `owner_attr` foreign key.
     - Manager: can do any request
-    - Client: can read (GET, HEAD, OPTIONS) or create (POST) any rental,
-              can PATCH/PUT/DELETE only their own rental
+    - Client: can read (GET, HEAD, OPTIONS) or create (POST) any object,
+              can PATCH/PUT/DELETE only their own object
     """
-
-    def has_permission(self, request, view):
-        user = request.user
-        if not user.is_authenticated:
-            return False
-
-        # Managers have full access
-        if user.role == UserChoice.MANAGER:
-            return True
-
-        # Clients can read or create
-        if user.role == UserChoice.CLIENT:
-            if request.method in SAFE_METHODS:  # GET, HEAD, OPTIONS
-                return True
-            if request.method == 'POST':        # create
+    owner_id_attr = f'{owner_attr}_id'
+
+    class _OwnerOrManager(BasePermission):
+        def has_permission(self, request, view):
+            if not request.user.is_authenticated:
+                return False
+            role = request.user.role
+            # Managers have full access; clients can read or create, and
+            # PATCH/PUT/DELETE must still pass the object-level check
+            return (
+                role == _MANAGER
+                or (role == _CLIENT and (
+                    request.method in SAFE_METHODS
+                    or request.method == 'POST'
+                    or request.method in _WRITE_METHODS
+                ))
+            )
+
+        def has_object_permission(self, request, view, obj):
+            role = request.user.role
+
+            # Managers => can do anything
+            if role == _MANAGER:
                 return True
-            # For PATCH/PUT/DELETE, must pass the object-level check
-            if request.method in ['PATCH', 'PUT', 'DELETE']:
-                return True
-
-        return False
-
-    def has_object_permission(self, request, view, obj):
-        user = request.user
 
-        # Managers => can do anything
-        if user.role == UserChoice.MANAGER:
-            return True
-
-        # Clients => must be the owner of the rental
-        if user.role == UserChoice.CLIENT:
-            return obj.client == user
-
-        return False
-
-
-class IsReservationOwnerOrManager(BasePermission):
-    """
-    Custom permission for ReservationModel.
-    - Manager: can do any request
-    - Client: can read (GET, HEAD, OPTIONS) or create (POST) any reservation,
-              can PATCH/PUT/DELETE only their own reservation
-    """
+            # Clients => must be the owner of the object
+            if role == _CLIENT:
+                return getattr(obj, owner_id_attr) == request.user.pk
 
-    def has_permission(self, request, view):
-        user = request.user
-        if not user.is_authenticated:
             return False
 
-        if user.role == UserChoice.MANAGER:
-            return True
-
-        if user.role == UserChoice.CLIENT:
-            if request.method in SAFE_METHODS:
-                return True
-            if request.method == 'POST':
-                return True
-            if request.method in ['PATCH', 'PUT', 'DELETE']:
-                return True
-
-        return False
-
-    def has_object_permission(self, request, view, obj):
-        user = request.user
-
-        if user.role == UserChoice.MANAGER:
-            return True
+    _OwnerOrManager.__name__ = _OwnerOrManager.__qualname__ = name
+    _OwnerOrManager.__doc__ = doc
+    return _OwnerOrManager
 
-        if user.role == UserChoice.CLIENT:
-            return obj.client == user
 
-        return False
\ No newline at end of file
+IsRentalOwnerOrManager = _make_owner_permission(
+    'client', 'IsRentalOwnerOrManager', 'Custom permission for RentalModel.'
+)
+IsReservationOwnerOrManager = _make_owner_permission(
+    'client', 'IsReservationOwnerOrManager', 'Custom permission for ReservationModel.'
+)
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_alter_paymentmodel_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='paymentmodel',
+            name='payments_pa_user_id_65ed5d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='paymentmodel',
+            index=models.Index(fields=['user', '-payment_time'], name='pay_user_time_desc_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:53
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_remove_paymentmodel_payments_pa_user_id_65ed5d_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='paymentmodel',
+            name='payments_pa_transac_07f561_idx',
+        ),
+        migrations.AlterField(
+            model_name='paymentmodel',
+            name='transaction_id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_remove_paymentmodel_payments_pa_transac_07f561_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='paymentmodel',
+            name='payments_pa_status_e00f30_idx',
+        ),
+        migrations.AlterField(
+            model_name='paymentmodel',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='paymentmodel',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['status'], name='pay_pending_idx'),
+        ),
+    ]
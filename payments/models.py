@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.db.models import Q
 
 
 class PaymentStatusChoices(models.TextChoices):
@@ -21,22 +22,24 @@ class PaymentModel(models.Model):
     status = models.CharField(
         max_length=20,
         choices=PaymentStatusChoices.choices,
-        default=PaymentStatusChoices.PENDING,
-        db_index=True
+        default=PaymentStatusChoices.PENDING
     )
     transaction_id = models.UUIDField(
         default=uuid.uuid4,
         editable=False,
-        unique=True,
-        db_index=True
+        unique=True
     )
 
     class Meta:
         ordering = ['-payment_time']
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['status']),
-            models.Index(fields=['transaction_id']),
+            models.Index(fields=['user', '-payment_time'], name='pay_user_time_desc_idx'),
+            # Only pending payments are ever looked up by status
+            models.Index(
+                fields=['status'],
+                name='pay_pending_idx',
+                condition=Q(status=PaymentStatusChoices.PENDING)
+            ),
         ]
 
     def __str__(self):
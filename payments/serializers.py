@@ -1,9 +1,16 @@
 import datetime
+import re
 
+from django.db.models import F
 from rest_framework import serializers
 
+from users.models import UserModel
 from .models import PaymentModel, PaymentStatusChoices
 
+_EXPIRY_RE = re.compile(r'^(0[1-9]|1[0-2])/(\d{2})$')
+# Strips ASCII digits; anything left over means the value was not all digits
+_NOT_DIGITS_TRANS = str.maketrans('', '', '0123456789')
+
 
 class PaymentSerializer(serializers.ModelSerializer):
     # Fields for the “test” payment flow
@@ -50,32 +57,25 @@ class PaymentSerializer(serializers.ModelSerializer):
 
     def validate_card_number(self, value):
         """Validate that the card number is exactly 16 digits."""
-        if len(value) != 16 or not value.isdigit():
+        if len(value) != 16 or value.translate(_NOT_DIGITS_TRANS):
             raise serializers.ValidationError("Invalid card number. Must be 16 digits.")
         return value
 
     def validate_expiry_date(self, value):
         """Validate expiry date is in MM/YY format and not expired."""
-        try:
-            month_str, year_str = value.split('/')
-            month = int(month_str)
-            year = int(year_str)
-            if not (1 <= month <= 12):
-                raise ValueError
-            # Assume 20xx for year
-            year += 2000
-            # Check if not expired
-            now = datetime.datetime.now()
-            last_day_of_month = datetime.datetime(year, month, 1) + datetime.timedelta(days=31)
-            if now > last_day_of_month:
-                raise serializers.ValidationError("Card is expired.")
-        except (ValueError, IndexError):
+        match = _EXPIRY_RE.match(value)
+        if match is None:
             raise serializers.ValidationError("Expiry date must be MM/YY (e.g. 12/25).")
+        month, year = int(match[1]), int(match[2])
+        # Cards stay valid through the last day of the expiry month
+        today = datetime.date.today()
+        if (year, month) < (today.year % 100, today.month):
+            raise serializers.ValidationError("Card is expired.")
         return value
 
     def validate_cvv(self, value):
         """Validate that CVV is exactly 3 digits."""
-        if len(value) != 3 or not value.isdigit():
+        if len(value) != 3 or value.translate(_NOT_DIGITS_TRANS):
             raise serializers.ValidationError("CVV must be 3 digits.")
         return value
 
@@ -107,9 +107,20 @@ class PaymentSerializer(serializers.ModelSerializer):
         # Create the payment record
         payment = PaymentModel.objects.create(**validated_data)
 
-        # Update user's balance
-        user = payment.user
-        user.balance += payment.amount
-        user.save()
+        # Update user's balance in a single UPDATE, safe against concurrent top-ups
+        UserModel.objects.filter(pk=payment.user_id).update(balance=F('balance') + payment.amount)
 
         return payment
+
+
+class PaymentListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for payment listings, fed with `.values()` rows
+    so no model instances are built per payment.
+    """
+    id = serializers.IntegerField(read_only=True)
+    user = serializers.IntegerField(read_only=True)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    payment_time = serializers.DateTimeField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    transaction_id = serializers.UUIDField(read_only=True)
@@ -1,4 +1,5 @@
 # payments/tests.py
+import datetime
 
 from django.urls import reverse
 from rest_framework.test import APITestCase
@@ -43,6 +44,9 @@ class PaymentAPITestCase(APITestCase):
         #   the list endpoint might be named 'paymentmodel-list' or 'payment-list'.
         self.payment_list_url = reverse('paymentmodel-list')
 
+        # An expiry date that is always in the future
+        self.valid_expiry = f'12/{(datetime.date.today().year + 1) % 100:02d}'
+
     def authenticate(self, user):
         """
         Helper method to authenticate a user with JWT tokens.
@@ -58,7 +62,7 @@ class PaymentAPITestCase(APITestCase):
         data = {
             'amount': '100.00',
             'card_number': '1234567812345678',  # 16 digits
-            'expiry_date': '12/25',            # MM/YY
+            'expiry_date': self.valid_expiry,   # MM/YY
             'cvv': '123'
         }
 
@@ -79,6 +83,23 @@ class PaymentAPITestCase(APITestCase):
         self.assertEqual(payment.amount, 100.00)
         self.assertEqual(payment.status, PaymentStatusChoices.COMPLETED)
 
+    def test_create_payment_queues_email_on_commit(self):
+        """
+        The receipt email is dispatched from an on-commit callback.
+        """
+        self.authenticate(self.client_user)
+        data = {
+            'amount': '20.00',
+            'card_number': '1234567812345678',
+            'expiry_date': self.valid_expiry,
+            'cvv': '123'
+        }
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.payment_list_url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(len(callbacks), 1)
+
     def test_create_payment_unauthenticated(self):
         """
         Unauthenticated user should not be allowed to create a payment.
@@ -114,8 +135,10 @@ class PaymentAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Client should only see 1 payment (their own)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(float(response.data[0]['amount']), 80.00)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(float(response.data['results'][0]['amount']), 80.00)
+        self.assertEqual(response.data['results'][0]['user'], self.client_user.id)
 
     def test_list_payments_as_manager(self):
         """
@@ -136,7 +159,8 @@ class PaymentAPITestCase(APITestCase):
         response = self.client.get(self.payment_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Manager should see both payments
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_invalid_card_details(self):
         """
@@ -155,3 +179,20 @@ class PaymentAPITestCase(APITestCase):
         self.assertIn('card_number', response.data)
         self.assertIn('expiry_date', response.data)
         self.assertIn('cvv', response.data)
+
+    def test_expired_card(self):
+        """
+        A card whose expiry month has passed is rejected.
+        """
+        self.authenticate(self.client_user)
+        last_year = (datetime.date.today().year - 1) % 100
+        data = {
+            'amount': '50.00',
+            'card_number': '1234567812345678',
+            'expiry_date': f'12/{last_year:02d}',
+            'cvv': '123'
+        }
+
+        response = self.client.post(self.payment_list_url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('expiry_date', response.data)
@@ -1,9 +1,12 @@
 # payments/utils.py
+from django.db import transaction
+
 from .tasks import send_payment_email_task
 
 
 def send_payment_email(payment_id):
     """
-    Triggers the Celery task to send a payment receipt email.
+    Triggers the Celery task to send a payment receipt email once the
+    current transaction commits, so the worker never sees a missing row.
     """
-    send_payment_email_task.delay(payment_id)
+    transaction.on_commit(lambda: send_payment_email_task.delay(payment_id))
@@ -1,24 +1,26 @@
 from django.db import transaction
-from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 
 from users.models import UserChoice
 from .models import PaymentModel
+from common.pagination import StandardPagination
 from common.permissions import IsClient
-from .serializers import PaymentSerializer
+from .serializers import PaymentSerializer, PaymentListSerializer
 from .utils import send_payment_email
 
 
-@method_decorator(gzip_page, name='dispatch')
 class PaymentViewSet(viewsets.ModelViewSet):
     """
     A ViewSet for handling test payments.
     """
     serializer_class = PaymentSerializer
     permission_classes = [IsClient]
-    queryset = PaymentModel.objects.select_related('user').all()
+    pagination_class = StandardPagination
+    # The serializer renders `user` as its primary key, so the user row is never needed
+    queryset = PaymentModel.objects.only(
+        'id', 'amount', 'payment_time', 'status', 'transaction_id', 'user_id'
+    ).all()
 
     def get_queryset(self):
         """
@@ -27,16 +29,27 @@ class PaymentViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         if user.role == UserChoice.MANAGER:
-            return self.queryset.order_by('-payment_time')
-        return self.queryset.filter(user=user).order_by('-payment_time')
+            queryset = self.queryset.order_by('-payment_time')
+        else:
+            queryset = self.queryset.filter(user=user).order_by('-payment_time')
+        if self.action == 'list':
+            # Listings are rendered from plain rows by PaymentListSerializer
+            return queryset.values('id', 'user', 'amount', 'payment_time', 'status', 'transaction_id')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return PaymentListSerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         """
         Handle payment creation within an atomic transaction.
+        The receipt email is queued once the transaction has committed.
         """
         with transaction.atomic():
             payment = serializer.save()
-            send_payment_email(payment.id)
+        send_payment_email(payment.id)
 
     @swagger_auto_schema(
         operation_id="create_payment",
@@ -59,8 +72,9 @@ class PaymentViewSet(viewsets.ModelViewSet):
         operation_id="list_payments",
         operation_summary="List payments",
         operation_description="List all payments for managers or own payments for clients.",
+        # The 200 schema, including the pagination envelope, is generated
+        # from the list serializer and StandardPagination
         responses={
-            200: PaymentSerializer(many=True),
             403: "Forbidden"
         }
     )
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0006_alter_rentalmodel_car_alter_rentalmodel_created_at_and_more'),
+        ('vehicles', '0002_alter_vehiclemodel_options_alter_vehiclemodel_brand_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='rentalmodel',
+            name='rentals_ren_status_fdc72b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='reservationmodel',
+            name='rentals_res_status_93d47d_idx',
+        ),
+        migrations.AlterField(
+            model_name='rentalmodel',
+            name='car',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='rentals', to='vehicles.vehiclemodel'),
+        ),
+        migrations.AlterField(
+            model_name='rentalmodel',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='rentals', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='rentalmodel',
+            name='start_date',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='rentalmodel',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AlterField(
+            model_name='reservationmodel',
+            name='car',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='vehicles.vehiclemodel'),
+        ),
+        migrations.AlterField(
+            model_name='reservationmodel',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0007_remove_rentalmodel_rentals_ren_status_fdc72b_idx_and_more'),
+        ('stations', '0003_alter_stationmodel_created_at_and_more'),
+        ('vehicles', '0002_alter_vehiclemodel_options_alter_vehiclemodel_brand_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='rentalmodel',
+            name='rentals_ren_car_id_9b8722_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='reservationmodel',
+            name='rentals_res_car_id_018220_idx',
+        ),
+        migrations.AddIndex(
+            model_name='rentalmodel',
+            index=models.Index(fields=['car', 'status', 'start_date', 'end_date'], name='rental_avail_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationmodel',
+            index=models.Index(fields=['car', 'status', 'start_date', 'end_date'], name='reservation_avail_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-15 23:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0008_remove_rentalmodel_rentals_ren_car_id_9b8722_idx_and_more'),
+        ('stations', '0003_alter_stationmodel_created_at_and_more'),
+        ('vehicles', '0002_alter_vehiclemodel_options_alter_vehiclemodel_brand_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rentalmodel',
+            name='end_date',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='rentalmodel',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['end_date'], name='rental_active_due'),
+        ),
+    ]
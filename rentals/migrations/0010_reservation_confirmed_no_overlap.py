@@ -0,0 +1,31 @@
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.operations
+import rentals.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0009_alter_rentalmodel_end_date_and_more'),
+    ]
+
+    operations = [
+        # Lets the GiST exclusion constraint compare car_id with =
+        django.contrib.postgres.operations.BtreeGistExtension(),
+        migrations.AddConstraint(
+            model_name='reservationmodel',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                condition=models.Q(('status', 'CONFIRMED')),
+                expressions=[
+                    ('car', '='),
+                    (rentals.models.TsTzRange(
+                        'start_date', 'end_date',
+                        django.contrib.postgres.fields.ranges.RangeBoundary(inclusive_upper=True)
+                    ), '&&'),
+                ],
+                name='reservation_confirmed_no_overlap',
+            ),
+        ),
+    ]
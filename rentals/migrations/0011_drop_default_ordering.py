@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-15 23:08
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0010_reservation_confirmed_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='rentalmodel',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='reservationmodel',
+            options={},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-15 23:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0011_drop_default_ordering'),
+        ('stations', '0003_alter_stationmodel_created_at_and_more'),
+        ('vehicles', '0002_alter_vehiclemodel_options_alter_vehiclemodel_brand_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='rentalmodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'ACTIVE')), fields=('client',), name='one_active_rental_per_client'),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary, RangeOperators
 from django.db import models
+from django.db.models import Func, Q
 
 from stations.models import StationModel
 from users.models import UserModel
@@ -18,12 +21,30 @@ class ReservationStatusChoices(models.TextChoices):
     CANCELLED = 'CANCELLED', 'Cancelled'
 
 
+RENTAL_STATUS_CHOICES = RentalStatusChoices.choices
+RESERVATION_STATUS_CHOICES = ReservationStatusChoices.choices
+
+# (current status, new status) pairs a rental may move through
+_VALID_RENTAL_TRANSITIONS = frozenset({
+    (RentalStatusChoices.PENDING, RentalStatusChoices.ACTIVE),
+    (RentalStatusChoices.PENDING, RentalStatusChoices.CANCELLED),
+    (RentalStatusChoices.ACTIVE, RentalStatusChoices.COMPLETED),
+    (RentalStatusChoices.ACTIVE, RentalStatusChoices.CANCELLED),
+})
+
+
+class TsTzRange(Func):
+    function = 'TSTZRANGE'
+    output_field = DateTimeRangeField()
+
+
 class RentalModel(models.Model):
+    # client/car lookups are served by the composite indexes in Meta
     client = models.ForeignKey(
-        UserModel, on_delete=models.CASCADE, related_name='rentals', db_index=True
+        UserModel, on_delete=models.CASCADE, related_name='rentals', db_index=False
     )
     car = models.ForeignKey(
-        VehicleModel, on_delete=models.CASCADE, related_name='rentals', db_index=True
+        VehicleModel, on_delete=models.CASCADE, related_name='rentals', db_index=False
     )
     pickup_station = models.ForeignKey(
         StationModel,
@@ -41,12 +62,12 @@ class RentalModel(models.Model):
         blank=True,
         db_index=True
     )
-    start_date = models.DateTimeField(db_index=True)
-    end_date = models.DateTimeField(null=True, blank=True, db_index=True)
-    total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0, db_index=True)
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField(null=True, blank=True)
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     status = models.CharField(
         max_length=20,
-        choices=RentalStatusChoices.choices,
+        choices=RENTAL_STATUS_CHOICES,
         default=RentalStatusChoices.PENDING,
         db_index=True
     )
@@ -54,39 +75,47 @@ class RentalModel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['client', 'status']),
-            models.Index(fields=['car', 'status']),
+            models.Index(fields=['car', 'status', 'start_date', 'end_date'], name='rental_avail_idx'),
             models.Index(fields=['start_date', 'end_date']),
-            models.Index(fields=['status']),
+            # Overdue sweeps only ever scan active rentals by end date
+            models.Index(
+                fields=['end_date'],
+                name='rental_active_due',
+                condition=Q(status=RentalStatusChoices.ACTIVE)
+            ),
+        ]
+        constraints = [
+            # A client may hold at most one active rental; this also serves
+            # the client's active-rental lookup as a partial index
+            models.UniqueConstraint(
+                fields=['client'],
+                condition=Q(status=RentalStatusChoices.ACTIVE),
+                name='one_active_rental_per_client',
+            ),
         ]
 
     def __str__(self):
-        return f"Rental {self.id} - {self.client.username} - {self.car}"
+        return f"Rental {self.id} - client {self.client_id} - car {self.car_id}"
 
     def can_transition_to(self, new_status):
-        valid_transitions = {
-            RentalStatusChoices.PENDING: [RentalStatusChoices.ACTIVE, RentalStatusChoices.CANCELLED],
-            RentalStatusChoices.ACTIVE: [RentalStatusChoices.COMPLETED, RentalStatusChoices.CANCELLED],
-            RentalStatusChoices.COMPLETED: [],
-            RentalStatusChoices.CANCELLED: []
-        }
-        return new_status in valid_transitions.get(self.status, [])
+        return (self.status, new_status) in _VALID_RENTAL_TRANSITIONS
 
 
 class ReservationModel(models.Model):
+    # client/car lookups are served by the composite indexes in Meta
     client = models.ForeignKey(
-        UserModel, on_delete=models.CASCADE, related_name='reservations', db_index=True
+        UserModel, on_delete=models.CASCADE, related_name='reservations', db_index=False
     )
     car = models.ForeignKey(
-        VehicleModel, on_delete=models.CASCADE, related_name='reservations', db_index=True
+        VehicleModel, on_delete=models.CASCADE, related_name='reservations', db_index=False
     )
     start_date = models.DateTimeField(db_index=True)
     end_date = models.DateTimeField(db_index=True)
     status = models.CharField(
         max_length=20,
-        choices=ReservationStatusChoices.choices,
+        choices=RESERVATION_STATUS_CHOICES,
         default=ReservationStatusChoices.PENDING,
         db_index=True
     )
@@ -94,12 +123,25 @@ class ReservationModel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['client', 'car', 'status']),
-            models.Index(fields=['car', 'start_date', 'end_date']),
-            models.Index(fields=['status']),
+            models.Index(fields=['car', 'status', 'start_date', 'end_date'], name='reservation_avail_idx'),
+        ]
+        constraints = [
+            # Two confirmed reservations of the same car may not overlap. The
+            # range is closed ('[]') to match the inclusive checks in the views.
+            ExclusionConstraint(
+                name='reservation_confirmed_no_overlap',
+                expressions=[
+                    ('car', RangeOperators.EQUAL),
+                    (
+                        TsTzRange('start_date', 'end_date', RangeBoundary(inclusive_upper=True)),
+                        RangeOperators.OVERLAPS,
+                    ),
+                ],
+                condition=Q(status=ReservationStatusChoices.CONFIRMED),
+            ),
         ]
 
     def __str__(self):
-        return f"Reservation {self.id} - {self.client.username} - {self.car}"
+        return f"Reservation {self.id} - client {self.client_id} - car {self.car_id}"
@@ -1,11 +1,44 @@
 from django.utils import timezone
 from rest_framework import serializers
 
+from stations.models import StationModel
+from stations.utils import get_cached_station
 from vehicles.models import VehicleStatusChoices
 from .models import RentalModel, ReservationModel
 
 
+def row_fields(serializer_class):
+    """
+    Return the model columns a read serializer renders, for building the
+    `.values()` rows it is fed on listings.
+    """
+    return tuple(field.source for field in serializer_class().fields.values())
+
+
+class CachedStationField(serializers.PrimaryKeyRelatedField):
+    """
+    Station primary key field that resolves the station through the station
+    cache instead of querying the table on every booking.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        station = get_cached_station(pk)
+        if station is None:
+            self.fail('does_not_exist', pk_value=data)
+        return station
+
+
 class RentalSerializer(serializers.ModelSerializer):
+    pickup_station = CachedStationField(queryset=StationModel.objects.all())
+    return_station = CachedStationField(
+        queryset=StationModel.objects.all(), required=False, allow_null=True
+    )
+
     class Meta:
         model = RentalModel
         fields = [
@@ -20,10 +53,17 @@ class RentalSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'start_date': {'required': True},
             'end_date': {'required': True},
-            'pickup_station': {'required': True},
-            'return_station': {'required': False},
         }
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Join the related rows a rental touches when it is read or updated.
+        Relations are rendered from their *_id columns, so only the car,
+        which cancellations update and name in notifications, is joined.
+        """
+        return queryset.select_related('car')
+
     def validate(self, data):
         """
         Validate date logic:
@@ -60,6 +100,23 @@ class RentalSerializer(serializers.ModelSerializer):
         return value
 
 
+class RentalReadSerializer(serializers.ModelSerializer):
+    """
+    Read-only rental representation used by list/retrieve. Relations are
+    rendered from their *_id columns, so no related-field querysets are bound
+    and listings can feed it `.values()` rows instead of model instances.
+    """
+    client = serializers.IntegerField(source='client_id', read_only=True)
+    car = serializers.IntegerField(source='car_id', read_only=True)
+    pickup_station = serializers.IntegerField(source='pickup_station_id', read_only=True)
+    return_station = serializers.IntegerField(source='return_station_id', read_only=True)
+
+    class Meta:
+        model = RentalModel
+        fields = RentalSerializer.Meta.fields
+        read_only_fields = fields
+
+
 class ReservationSerializer(serializers.ModelSerializer):
     class Meta:
         model = ReservationModel
@@ -87,11 +144,28 @@ class ReservationSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """Validate date logic."""
+        # Both dates are required, so they can only be missing on a partial
+        # update; ReservationViewSet.http_method_names rules those out today
         start_date = data.get('start_date')
         end_date = data.get('end_date')
 
-        if start_date > end_date:
-            raise serializers.ValidationError("End date must be greater than start date.")
-        if start_date < timezone.now():
-            raise serializers.ValidationError("Cannot reserve a car in the past.")
+        if start_date is not None and end_date is not None:
+            if start_date > end_date:
+                raise serializers.ValidationError("End date must be greater than start date.")
+            if start_date < timezone.now():
+                raise serializers.ValidationError("Cannot reserve a car in the past.")
         return data
+
+
+class ReservationReadSerializer(serializers.ModelSerializer):
+    """
+    Read-only reservation representation used by list/retrieve, rendered
+    from model instances or `.values()` rows alike.
+    """
+    client = serializers.IntegerField(source='client_id', read_only=True)
+    car = serializers.IntegerField(source='car_id', read_only=True)
+
+    class Meta:
+        model = ReservationModel
+        fields = ReservationSerializer.Meta.fields
+        read_only_fields = fields
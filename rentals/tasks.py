@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import send_mail, send_mass_mail
 from celery import shared_task
 from users.models import UserModel
 
@@ -9,11 +9,27 @@ def send_email_notifications_task(user_id, subject, message):
     """
     Send email notifications to the user.
     """
-    user = UserModel.objects.get(pk=user_id)
+    email = UserModel.objects.values_list('email', flat=True).get(pk=user_id)
     send_mail(
         subject=subject,
         message=message,
         from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
+        recipient_list=[email],
         fail_silently=False,
-    )
\ No newline at end of file
+    )
+
+
+@shared_task
+def send_email_notifications_bulk_task(payloads):
+    """
+    Send several email notifications over a single SMTP connection.
+    :param payloads: List of (user_id, subject, message) items
+    """
+    user_ids = {user_id for user_id, _, _ in payloads}
+    emails = dict(UserModel.objects.filter(pk__in=user_ids).values_list('id', 'email'))
+    messages = [
+        (subject, message, settings.DEFAULT_FROM_EMAIL, [emails[user_id]])
+        for user_id, subject, message in payloads
+        if user_id in emails
+    ]
+    send_mass_mail(messages, fail_silently=False)
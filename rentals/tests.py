@@ -1,6 +1,12 @@
 # tests.py
 
 import datetime
+import math
+from unittest import mock, skipUnless
+
+from django.core import mail
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.urls import reverse
 from rest_framework import status
@@ -16,6 +22,13 @@ from .models import (
     RentalStatusChoices,
     ReservationStatusChoices,
 )
+from .tasks import send_email_notifications_bulk_task
+from .utils import calculate_distance, is_near_station, send_bulk_email_notifications
+
+# Argument-free routes are resolved once for the whole module
+RENTAL_LIST_URL = reverse('rentalmodel-list')
+RESERVATION_LIST_URL = reverse('reservationmodel-list')
+RETURN_CAR_URL = reverse('rentalmodel-return-car-to-station')
 
 
 class RentalAppTestBase(APITestCase):
@@ -28,9 +41,10 @@ class RentalAppTestBase(APITestCase):
       - Two API clients authenticated via Simple JWT
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create users
-        self.manager_user = UserModel.objects.create_user(
+        cls.manager_user = UserModel.objects.create_user(
             username='manager',
             email='manager@test.com',
             password='managerpass',
@@ -38,7 +52,7 @@ class RentalAppTestBase(APITestCase):
             balance=10000,
             is_verified=True
         )
-        self.client_user = UserModel.objects.create_user(
+        cls.client_user = UserModel.objects.create_user(
             username='client',
             email='client@test.com',
             password='clientpass',
@@ -48,7 +62,7 @@ class RentalAppTestBase(APITestCase):
         )
 
         # Create an active station
-        self.station = StationModel.objects.create(
+        cls.station = StationModel.objects.create(
             name="Main Station",
             latitude=40.7128,
             longitude=-74.0060,
@@ -56,25 +70,28 @@ class RentalAppTestBase(APITestCase):
         )
 
         # Create a vehicle
-        self.vehicle = VehicleModel.objects.create(
+        cls.vehicle = VehicleModel.objects.create(
             brand="Toyota",
             model="Corolla",
             daily_price=100,
             status=VehicleStatusChoices.AVAILABLE,
-            current_station=self.station
+            current_station=cls.station
         )
 
+        # Sign the access tokens once; they stay valid for the whole class
+        cls.manager_access = str(RefreshToken.for_user(cls.manager_user).access_token)
+        cls.client_access = str(RefreshToken.for_user(cls.client_user).access_token)
+
+    def setUp(self):
         # Create API clients with JWT credentials
-        manager_token = RefreshToken.for_user(self.manager_user)
         self.client_manager = APIClient()
         self.client_manager.credentials(
-            HTTP_AUTHORIZATION=f'Bearer {manager_token.access_token}'
+            HTTP_AUTHORIZATION=f'Bearer {self.manager_access}'
         )
 
-        client_token = RefreshToken.for_user(self.client_user)
         self.client_client = APIClient()
         self.client_client.credentials(
-            HTTP_AUTHORIZATION=f'Bearer {client_token.access_token}'
+            HTTP_AUTHORIZATION=f'Bearer {self.client_access}'
         )
 
 
@@ -87,7 +104,7 @@ class TestRentalViewSet(RentalAppTestBase):
         """
         A verified client with sufficient balance should be able to create a new rental.
         """
-        url = reverse('rentalmodel-list')  # Adjust to your actual route name
+        url = RENTAL_LIST_URL
         start_date = timezone.now() + datetime.timedelta(days=1)
         end_date = timezone.now() + datetime.timedelta(days=2)
 
@@ -100,23 +117,22 @@ class TestRentalViewSet(RentalAppTestBase):
 
         response = self.client_client.post(url, data=payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
-        rental = RentalModel.objects.last()
-        self.assertIsNotNone(rental)
+        rental = RentalModel.objects.get(pk=response.data['id'])
         self.assertEqual(rental.client, self.client_user)
         self.assertEqual(rental.car, self.vehicle)
         self.assertEqual(rental.status, RentalStatusChoices.PENDING)
-        # Check that the user balance has been deducted
+        # Check that the user balance has been deducted (1 day x 100)
         self.client_user.refresh_from_db()
-        self.assertLess(self.client_user.balance, 5000)
+        self.assertEqual(self.client_user.balance, 5000 - 100)
 
     def test_create_rental_insufficient_balance(self):
         """
         If a client does not have sufficient balance, rental creation should fail.
         """
         self.client_user.balance = 10
-        self.client_user.save()
+        self.client_user.save(update_fields=['balance'])
 
-        url = reverse('rentalmodel-list')
+        url = RENTAL_LIST_URL
         start_date = timezone.now() + datetime.timedelta(days=1)
         end_date = timezone.now() + datetime.timedelta(days=2)
 
@@ -135,7 +151,7 @@ class TestRentalViewSet(RentalAppTestBase):
         """
         Rental start_date must not be in the past.
         """
-        url = reverse('rentalmodel-list')
+        url = RENTAL_LIST_URL
         start_date = timezone.now() - datetime.timedelta(days=1)
         end_date = timezone.now() + datetime.timedelta(days=2)
 
@@ -154,36 +170,57 @@ class TestRentalViewSet(RentalAppTestBase):
         # Original user balance is 5000
         old_balance = self.client_user.balance
 
-        # STEP 1: Create rental via POST
-        url = reverse('rentalmodel-list')
-        payload = {
-            "car": self.vehicle.id,
-            "pickup_station": self.station.id,
-            "start_date": (timezone.now() + datetime.timedelta(days=1)).isoformat(),
-            "end_date": (timezone.now() + datetime.timedelta(days=3)).isoformat(),
-        }
-        create_response = self.client_client.post(url, data=payload, format='json')
-        self.assertEqual(create_response.status_code, status.HTTP_201_CREATED, create_response.data)
-
-        # The user is now charged in perform_create()
-        self.client_user.refresh_from_db()
-        # If total_amount was 200, user.balance should be 5000 - 200 = 4800
-        self.assertEqual(self.client_user.balance, old_balance - 200)
+        # STEP 1: A pending rental the client has already been charged 200 for
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            pickup_station=self.station,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=3),
+            total_amount=200,
+            status=RentalStatusChoices.PENDING
+        )
+        self.client_user.balance -= 200
+        self.client_user.save(update_fields=['balance'])
 
         # STEP 2: Cancel the rental
-        rental_id = create_response.data["id"]
-        detail_url = reverse('rentalmodel-detail', args=[rental_id])
+        detail_url = reverse('rentalmodel-detail', args=[rental.id])
         cancel_response = self.client_client.patch(
             detail_url,
             data={"status": RentalStatusChoices.CANCELLED},
             format='json'
         )
         self.assertEqual(cancel_response.status_code, status.HTTP_200_OK, cancel_response.data)
+        self.assertEqual(cancel_response.data['status'], RentalStatusChoices.CANCELLED)
 
         # Now they should have been refunded 200
         self.client_user.refresh_from_db()
         self.assertEqual(self.client_user.balance, old_balance)
 
+    def test_client_cancel_twice_refunds_once(self):
+        """
+        Cancelling an already cancelled rental is rejected and does not refund again.
+        """
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            pickup_station=self.station,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=2),
+            total_amount=200,
+            status=RentalStatusChoices.PENDING
+        )
+        old_balance = self.client_user.balance
+
+        url = reverse('rentalmodel-detail', args=[rental.id])
+        first = self.client_client.patch(url, data={"status": RentalStatusChoices.CANCELLED}, format='json')
+        self.assertEqual(first.status_code, status.HTTP_200_OK, first.data)
+        second = self.client_client.patch(url, data={"status": RentalStatusChoices.CANCELLED}, format='json')
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST, second.data)
+
+        self.client_user.refresh_from_db()
+        self.assertEqual(self.client_user.balance, old_balance + 200)
+
     def test_client_cannot_cancel_active_rental_via_update(self):
         """
         A client cannot cancel an ACTIVE rental via the same update endpoint (invalid transition).
@@ -257,6 +294,65 @@ class TestRentalViewSet(RentalAppTestBase):
         self.vehicle.refresh_from_db()
         self.assertEqual(self.vehicle.status, VehicleStatusChoices.AVAILABLE)
 
+    def test_client_delete_cancels_pending_rental(self):
+        """
+        A client DELETE cancels their PENDING rental instead of removing it,
+        refunding the user and releasing the vehicle.
+        """
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            pickup_station=self.station,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=2),
+            total_amount=200,
+            status=RentalStatusChoices.PENDING
+        )
+        old_balance = self.client_user.balance
+        url = reverse('rentalmodel-detail', args=[rental.id])
+        response = self.client_client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data['status'], RentalStatusChoices.CANCELLED)
+
+        rental.refresh_from_db()
+        self.assertEqual(rental.status, RentalStatusChoices.CANCELLED)
+
+        self.client_user.refresh_from_db()
+        self.assertEqual(self.client_user.balance, old_balance + 200)
+
+        # A second DELETE finds nothing pending and does not refund again
+        response = self.client_client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
+        self.client_user.refresh_from_db()
+        self.assertEqual(self.client_user.balance, old_balance + 200)
+
+    def test_role_is_read_from_the_user_row(self):
+        """
+        Permissions and listings follow request.user.role: a manager demoted
+        to client loses manager access with the token already issued.
+        """
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            pickup_station=self.station,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=2),
+            total_amount=200,
+            status=RentalStatusChoices.PENDING
+        )
+        UserModel.objects.filter(pk=self.manager_user.pk).update(role=UserChoice.CLIENT)
+
+        response = self.client_manager.get(RENTAL_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+        url = reverse('rentalmodel-set-status', args=[rental.id])
+        response = self.client_manager.post(url, data={"status": RentalStatusChoices.CANCELLED}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN, response.data)
+
+        rental.refresh_from_db()
+        self.assertEqual(rental.status, RentalStatusChoices.PENDING)
+
     def test_manager_set_rental_status_active(self):
         """
         Manager can set rental status to ACTIVE via set-status endpoint.
@@ -280,6 +376,31 @@ class TestRentalViewSet(RentalAppTestBase):
         self.vehicle.refresh_from_db()
         self.assertEqual(self.vehicle.status, VehicleStatusChoices.RENTED)
 
+    def test_manager_cannot_activate_second_rental_for_client(self):
+        """
+        A client can hold only one ACTIVE rental at a time.
+        """
+        RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=2),
+            status=RentalStatusChoices.ACTIVE
+        )
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            start_date=timezone.now() + datetime.timedelta(days=3),
+            end_date=timezone.now() + datetime.timedelta(days=4),
+            status=RentalStatusChoices.PENDING
+        )
+        url = reverse('rentalmodel-set-status', args=[rental.id])
+        response = self.client_manager.post(url, data={"status": RentalStatusChoices.ACTIVE}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
+
+        rental.refresh_from_db()
+        self.assertEqual(rental.status, RentalStatusChoices.PENDING)
+
     def test_client_return_car_to_station_success(self):
         """
         Client returns the car to a station. Must have an ACTIVE rental, must be near the station.
@@ -294,7 +415,7 @@ class TestRentalViewSet(RentalAppTestBase):
             status=RentalStatusChoices.ACTIVE
         )
         # We assume the user is 'near' the station (matching lat/lon)
-        url = reverse('rentalmodel-return-car-to-station')
+        url = RETURN_CAR_URL
         payload = {
             "return_station": self.station.id,
             "latitude": float(self.station.latitude),  # exact match
@@ -324,7 +445,7 @@ class TestRentalViewSet(RentalAppTestBase):
             total_amount=100,
             status=RentalStatusChoices.ACTIVE
         )
-        url = reverse('rentalmodel-return-car-to-station')
+        url = RETURN_CAR_URL
         payload = {
             "return_station": self.station.id,
             "latitude": 0.0,  # far from station
@@ -335,6 +456,71 @@ class TestRentalViewSet(RentalAppTestBase):
         self.assertIn("You are not near the station.", str(response.data))
 
 
+    def test_manager_cannot_return_car(self):
+        """
+        Returning a car is a client-only action.
+        """
+        response = self.client_manager.post(RETURN_CAR_URL, data={
+            "return_station": self.station.id,
+            "latitude": float(self.station.latitude),
+            "longitude": float(self.station.longitude)
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_client_lists_own_rentals(self):
+        """
+        A client only sees their own rentals, with relations rendered as ids.
+        """
+        rental = RentalModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            pickup_station=self.station,
+            start_date=timezone.now() + datetime.timedelta(days=1),
+            end_date=timezone.now() + datetime.timedelta(days=2),
+            total_amount=100,
+        )
+        RentalModel.objects.create(
+            client=self.manager_user,
+            car=self.vehicle,
+            start_date=timezone.now() + datetime.timedelta(days=3),
+            end_date=timezone.now() + datetime.timedelta(days=4),
+        )
+
+        response = self.client_client.get(RENTAL_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], rental.id)
+        self.assertEqual(response.data[0]['client'], self.client_user.id)
+        self.assertEqual(response.data[0]['car'], self.vehicle.id)
+        self.assertEqual(response.data[0]['pickup_station'], self.station.id)
+        self.assertIsNone(response.data[0]['return_station'])
+
+    def test_rental_list_query_count_does_not_grow_with_rows(self):
+        """
+        Listing rentals costs the same number of queries for one row as for many.
+        """
+        def create_rental(days):
+            RentalModel.objects.create(
+                client=self.client_user,
+                car=self.vehicle,
+                pickup_station=self.station,
+                return_station=self.station,
+                start_date=timezone.now() + datetime.timedelta(days=days),
+                end_date=timezone.now() + datetime.timedelta(days=days + 1),
+                total_amount=100,
+            )
+
+        create_rental(1)
+        with CaptureQueriesContext(connection) as single:
+            self.client_manager.get(RENTAL_LIST_URL)
+
+        for days in range(2, 7):
+            create_rental(days)
+        with self.assertNumQueries(len(single)):
+            response = self.client_manager.get(RENTAL_LIST_URL)
+        self.assertEqual(len(response.data), 6)
+
+
 class TestReservationViewSet(RentalAppTestBase):
     """
     Test cases for ReservationViewSet endpoints.
@@ -344,7 +530,7 @@ class TestReservationViewSet(RentalAppTestBase):
         """
         A verified client can create a reservation for an available vehicle in a valid period.
         """
-        url = reverse('reservationmodel-list')  # e.g. "/reservations/"
+        url = RESERVATION_LIST_URL  # e.g. "/reservations/"
         start_date = timezone.now() + datetime.timedelta(days=2)
         end_date = timezone.now() + datetime.timedelta(days=3)
         payload = {
@@ -355,17 +541,33 @@ class TestReservationViewSet(RentalAppTestBase):
         response = self.client_client.post(url, data=payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
 
-        reservation = ReservationModel.objects.last()
-        self.assertIsNotNone(reservation)
+        reservation = ReservationModel.objects.get(pk=response.data['id'])
         self.assertEqual(reservation.client, self.client_user)
         self.assertEqual(reservation.car, self.vehicle)
         self.assertEqual(reservation.status, ReservationStatusChoices.PENDING)
 
+    def test_manager_lists_all_reservations(self):
+        """
+        A manager sees every reservation, with relations rendered as ids.
+        """
+        ReservationModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            start_date=timezone.now() + datetime.timedelta(days=2),
+            end_date=timezone.now() + datetime.timedelta(days=3),
+        )
+
+        response = self.client_manager.get(RESERVATION_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['client'], self.client_user.id)
+        self.assertEqual(response.data[0]['car'], self.vehicle.id)
+
     def test_create_reservation_in_the_past(self):
         """
         Reservation start_date cannot be in the past.
         """
-        url = reverse('reservationmodel-list')
+        url = RESERVATION_LIST_URL
         start_date = timezone.now() - datetime.timedelta(days=1)
         end_date = timezone.now() + datetime.timedelta(days=1)
         payload = {
@@ -389,7 +591,7 @@ class TestReservationViewSet(RentalAppTestBase):
             status=ReservationStatusChoices.PENDING
         )
 
-        url = reverse('reservationmodel-list')
+        url = RESERVATION_LIST_URL
         payload = {
             "car": self.vehicle.id,
             "start_date": (timezone.now() + datetime.timedelta(days=1)).isoformat(),
@@ -418,6 +620,80 @@ class TestReservationViewSet(RentalAppTestBase):
         reservation.refresh_from_db()
         self.assertEqual(reservation.status, ReservationStatusChoices.CONFIRMED)
 
+    def test_manager_cannot_confirm_overlapping_reservation(self):
+        """
+        Confirming a reservation that overlaps a confirmed one for the same car is rejected.
+        """
+        start = timezone.now() + datetime.timedelta(days=3)
+        ReservationModel.objects.create(
+            client=self.manager_user,
+            car=self.vehicle,
+            start_date=start,
+            end_date=start + datetime.timedelta(days=2),
+            status=ReservationStatusChoices.CONFIRMED
+        )
+        reservation = ReservationModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            start_date=start + datetime.timedelta(days=1),
+            end_date=start + datetime.timedelta(days=3),
+            status=ReservationStatusChoices.PENDING
+        )
+        url = reverse('reservationmodel-set-status', args=[reservation.id])
+        response = self.client_manager.post(url, data={"status": ReservationStatusChoices.CONFIRMED}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
+
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, ReservationStatusChoices.PENDING)
+
+    def test_confirm_constraint_violation_returns_400(self):
+        """
+        A confirmation that passes the overlap check but loses the race to the
+        exclusion constraint is reported as a 400, not a 500.
+        """
+        reservation = ReservationModel.objects.create(
+            client=self.client_user,
+            car=self.vehicle,
+            start_date=timezone.now() + datetime.timedelta(days=3),
+            end_date=timezone.now() + datetime.timedelta(days=4),
+            status=ReservationStatusChoices.PENDING
+        )
+        url = reverse('reservationmodel-set-status', args=[reservation.id])
+        violation = IntegrityError('conflicting key value violates exclusion constraint '
+                                   '"reservation_confirmed_no_overlap"')
+        with mock.patch.object(ReservationModel, 'save', side_effect=violation):
+            response = self.client_manager.post(
+                url, data={"status": ReservationStatusChoices.CONFIRMED}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
+        self.assertIn("overlaps", response.data['error'])
+
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, ReservationStatusChoices.PENDING)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Exclusion constraints require PostgreSQL')
+    def test_overlapping_confirmed_reservations_violate_constraint(self):
+        """
+        The database rejects a second confirmed reservation overlapping the
+        first, even when the view-level check is bypassed.
+        """
+        start = timezone.now() + datetime.timedelta(days=3)
+        ReservationModel.objects.create(
+            client=self.manager_user,
+            car=self.vehicle,
+            start_date=start,
+            end_date=start + datetime.timedelta(days=2),
+            status=ReservationStatusChoices.CONFIRMED
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ReservationModel.objects.create(
+                client=self.client_user,
+                car=self.vehicle,
+                start_date=start + datetime.timedelta(days=2),
+                end_date=start + datetime.timedelta(days=3),
+                status=ReservationStatusChoices.CONFIRMED
+            )
+
     def test_manager_cancel_reservation(self):
         """
         Manager can cancel a PENDING or CONFIRMED reservation.
@@ -457,3 +733,71 @@ class TestReservationViewSet(RentalAppTestBase):
         # Attempt delete
         response = self.client_client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED, response.data)
+
+
+class TestEmailNotificationTasks(RentalAppTestBase):
+    """
+    Tests for the rental email notification tasks.
+    """
+
+    def test_bulk_notifications_send_one_mail_per_payload(self):
+        """
+        The bulk task resolves recipients in one query and sends every message.
+        """
+        send_email_notifications_bulk_task([
+            [self.client_user.id, "Reminder", "Your rental ends soon."],
+            [self.manager_user.id, "Report", "Daily report."],
+        ])
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, [self.client_user.email])
+        self.assertEqual(mail.outbox[1].subject, "Report")
+
+    def test_bulk_notifications_enqueue_one_task_per_chunk(self):
+        """
+        Payloads are split into chunks of at most 100, one task per chunk.
+        """
+        payloads = [(self.client_user.id, "Reminder", f"Message {i}") for i in range(250)]
+
+        with mock.patch('rentals.utils.send_email_notifications_bulk_task.delay') as delay:
+            send_bulk_email_notifications(payloads)
+
+        self.assertEqual(delay.call_count, 3)
+        chunk_sizes = [len(call.args[0]) for call in delay.call_args_list]
+        self.assertEqual(chunk_sizes, [100, 100, 50])
+        self.assertEqual(delay.call_args_list[2].args[0][-1], [self.client_user.id, "Reminder", "Message 249"])
+
+
+class TestIsNearStation(RentalAppTestBase):
+    """
+    Tests for the station proximity check.
+    """
+
+    def test_station_instance_and_degrees_agree(self):
+        """
+        Passing the station or its coordinates in degrees gives the same answer.
+        """
+        station = StationModel.objects.get(pk=self.station.pk)
+        for user_lat, user_lon, expected in [(40.7130, -74.0050, True), (41.0, -74.0060, False)]:
+            self.assertIs(is_near_station(user_lat, user_lon, station=station), expected)
+            self.assertIs(
+                is_near_station(user_lat, user_lon, station.latitude, station.longitude),
+                expected
+            )
+
+    def test_calculate_distance_is_exact_haversine(self):
+        """
+        calculate_distance returns the exact great-circle distance.
+        """
+        # One degree of longitude along the equator is exactly 1/360 of the circumference
+        self.assertAlmostEqual(calculate_distance(0, 0, 0, 1), 2 * math.pi * 6371.0088 / 360, places=9)
+        # New York to London
+        self.assertAlmostEqual(calculate_distance(40.7128, -74.0060, 51.5074, -0.1278), 5570.2299, places=3)
+
+    def test_near_across_the_antimeridian(self):
+        """
+        Points either side of the 180th meridian are treated as close together.
+        """
+        self.assertTrue(is_near_station(0, 179.99, 0, -179.99, max_distance=5))
+        self.assertTrue(is_near_station(0, -179.99, 0, 179.99, max_distance=5))
+        self.assertFalse(is_near_station(0, 179.9, 0, -179.9, max_distance=5))
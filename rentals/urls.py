@@ -1,9 +1,11 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import RentalViewSet, ReservationViewSet
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'reservations', ReservationViewSet)
+# Registered last: rentals live at the app root, and their numeric-only pk
+# lookup keeps them from matching the other prefixes
 router.register(r'', RentalViewSet)
 
 urlpatterns = [
@@ -1,8 +1,10 @@
-from math import radians, sin, cos, sqrt, atan2
+from math import pi, radians, sin, cos, sqrt, atan2
 
 from django.conf import settings
-from django.core.mail import send_mail
-from .tasks import send_email_notifications_task
+from .tasks import send_email_notifications_task, send_email_notifications_bulk_task
+
+# Mean radius of the Earth in kilometers (WGS84)
+_EARTH_R_KM = 6371.0088
 
 
 def calculate_distance(lat1, lon1, lat2, lon2):
@@ -11,8 +13,6 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     on the Earth specified by latitude and longitude using the Haversine formula.
     Returns distance in kilometers.
     """
-    R = 6371  # Radius of the Earth in kilometers
-
     lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
 
     dlat = lat2 - lat1
@@ -21,23 +21,50 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
     c = 2 * atan2(sqrt(a), sqrt(1 - a))
 
-    distance = R * c
+    distance = _EARTH_R_KM * c
 
     return distance
 
 
-def is_near_station(user_lat, user_lon, station_lat, station_lon, max_distance=settings.MAX_DISTANCE):
+def _within_distance(lat1, lon1, lat2, lon2, max_distance):
+    """
+    Check whether two points given in radians are within `max_distance`
+    kilometers of each other.
+    """
+    # Over the few kilometres this check covers, the equirectangular
+    # approximation is as good as Haversine and needs no sqrt/atan2.
+    # Wrap the longitude delta into [-pi, pi) so points either side of the
+    # 180th meridian come out close together
+    dlon = (lon2 - lon1 + pi) % (2 * pi) - pi
+    x = dlon * cos((lat1 + lat2) / 2)
+    y = lat2 - lat1
+    max_distance = float(max_distance)
+
+    return (x * x + y * y) * _EARTH_R_KM * _EARTH_R_KM <= max_distance * max_distance
+
+
+def is_near_station(user_lat, user_lon, station_lat=None, station_lon=None,
+                    max_distance=settings.MAX_DISTANCE, *, station=None):
     """
     Determine if the user is within `max_distance` kilometers of the station.
     :param user_lat: User's latitude
     :param user_lon: User's longitude
-    :param station_lat: Station's latitude
-    :param station_lon: Station's longitude
+    :param station_lat: Station's latitude, if `station` is not given
+    :param station_lon: Station's longitude, if `station` is not given
     :param max_distance: Maximum distance in kilometers
+    :param station: StationModel instance; its coordinates already converted
+                    to radians are reused
     :return: True if the user is near the station, False otherwise
     """
-    distance = calculate_distance(user_lat, user_lon, station_lat, station_lon)
-    return distance <= max_distance
+    if station is not None:
+        station_lat, station_lon = station.coordinates_rad
+    else:
+        station_lat, station_lon = radians(float(station_lat)), radians(float(station_lon))
+    return _within_distance(
+        radians(float(user_lat)), radians(float(user_lon)),
+        station_lat, station_lon,
+        max_distance,
+    )
 
 
 def send_email_notification(user_id, subject, message):
@@ -47,4 +74,16 @@ def send_email_notification(user_id, subject, message):
     :param subject: Email subject
     :param message: Email message
     """
-    send_email_notifications_task.delay(user_id, subject, message)
\ No newline at end of file
+    send_email_notifications_task.delay(user_id, subject, message)
+
+
+def send_bulk_email_notifications(payloads, chunk_size=100):
+    """
+    Send many email notifications, enqueueing one Celery task (and one SMTP
+    connection) per `chunk_size` messages.
+    :param payloads: Iterable of (user_id, subject, message) tuples
+    :param chunk_size: Maximum number of messages per task
+    """
+    payloads = [list(payload) for payload in payloads]
+    for start in range(0, len(payloads), chunk_size):
+        send_email_notifications_bulk_task.delay(payloads[start:start + chunk_size])
@@ -1,7 +1,6 @@
-from django.db import transaction
-from django.db.models import F
-from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers
@@ -10,55 +9,120 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from common.permissions import IsRentalOwnerOrManager, IsManager, IsReservationOwnerOrManager, IsClient
-from stations.models import StationModel
+from stations.utils import get_cached_station
 from users.models import UserChoice, UserModel
 from vehicles.models import VehicleModel, VehicleStatusChoices
-from .models import RentalModel, ReservationModel, RentalStatusChoices, ReservationStatusChoices
-from .serializers import RentalSerializer, ReservationSerializer
+from .models import (
+    RentalModel, ReservationModel, RentalStatusChoices, ReservationStatusChoices,
+    RENTAL_STATUS_CHOICES, RESERVATION_STATUS_CHOICES,
+)
+from .serializers import (
+    RentalSerializer, ReservationSerializer, RentalReadSerializer, ReservationReadSerializer,
+    row_fields,
+)
 from .utils import is_near_station, send_email_notification
 
 
-@method_decorator(gzip_page, name='dispatch')
+_RESERVATION_STATUSES = frozenset(choice[0] for choice in RESERVATION_STATUS_CHOICES)
+
+
+def _set_status_schema(choices, description):
+    return openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'status': openapi.Schema(
+                type=openapi.TYPE_STRING,
+                enum=[choice[0] for choice in choices],
+                description=description
+            )
+        }
+    )
+
+
+# Columns fetched for listings, keyed the way the read serializers look them up
+_RENTAL_ROW_FIELDS = row_fields(RentalReadSerializer)
+_RESERVATION_ROW_FIELDS = row_fields(ReservationReadSerializer)
+
+# Request bodies documented on the custom actions, built once at import
+_RENTAL_SET_STATUS_SCHEMA = _set_status_schema(RENTAL_STATUS_CHOICES, 'New status for the rental')
+_RESERVATION_SET_STATUS_SCHEMA = _set_status_schema(RESERVATION_STATUS_CHOICES, 'New status for the reservation')
+_RETURN_CAR_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'return_station': openapi.Schema(type=openapi.TYPE_INTEGER),
+        'latitude': openapi.Schema(type=openapi.TYPE_NUMBER),
+        'longitude': openapi.Schema(type=openapi.TYPE_NUMBER),
+    }
+)
+
+
 class RentalViewSet(viewsets.ModelViewSet):
     """
     A viewset for viewing and editing rental instances.
     """
     serializer_class = RentalSerializer
     permission_classes = [IsRentalOwnerOrManager]
-    queryset = RentalModel.objects.select_related('car', 'client', 'pickup_station', 'return_station').all()
+    queryset = RentalSerializer.setup_eager_loading(RentalModel.objects.order_by('-created_at'))
+    lookup_value_regex = r'\d+'
 
     def get_queryset(self):
         """
         Override the default `get_queryset` to handle filtering based on user role.
         """
         user = self.request.user
-        if user.is_authenticated and user.role == UserChoice.CLIENT:
-            return self.queryset.filter(client=user)
-        elif user.is_authenticated and user.role == UserChoice.MANAGER:
-            return self.queryset.all()
-        return RentalModel.objects.none()
+        role = user.role if user.is_authenticated else None
+        if role == UserChoice.CLIENT:
+            queryset = self.queryset.filter(client=user)
+        elif role == UserChoice.MANAGER:
+            queryset = self.queryset.all()
+        else:
+            return RentalModel.objects.none()
+        if self.action == 'list':
+            # Listings are rendered from plain rows, with relations as the
+            # raw *_id values, so the joins are dropped as well
+            return queryset.select_related(None).values(*_RENTAL_ROW_FIELDS)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in ('list', 'retrieve'):
+            return RentalReadSerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         """
         Handle rental creation within an atomic transaction.
         """
         with transaction.atomic():
-            user = UserModel.objects.select_for_update().get(id=self.request.user.id)
-            car = VehicleModel.objects.select_for_update().get(id=self.request.data['car'])
+            # No lock on the user row: the charge below is a guarded UPDATE and
+            # one_active_rental_per_client caps active rentals
+            user = self.request.user
+            start_date = serializer.validated_data['start_date']
+            end_date = serializer.validated_data['end_date']
+
+            # Lock the car and evaluate both booking checks in the same query;
+            # only the price and the fields its __str__ needs are loaded
+            car = VehicleModel.objects.select_for_update().only(
+                'id', 'brand', 'model', 'daily_price'
+            ).annotate(
+                client_has_active_rental=Exists(
+                    RentalModel.objects.filter(client=user, status=RentalStatusChoices.ACTIVE)
+                ),
+                reserved_in_period=Exists(
+                    ReservationModel.objects.filter(
+                        car=OuterRef('pk'),
+                        start_date__lte=end_date,
+                        end_date__gte=start_date,
+                        status=ReservationStatusChoices.CONFIRMED
+                    )
+                ),
+            ).get(id=self.request.data['car'])
 
             # Ensure client does not have an active rental
-            if RentalModel.objects.filter(client=user, status=RentalStatusChoices.ACTIVE).exists():
+            if car.client_has_active_rental:
                 raise serializers.ValidationError("You already have an active rental.")
 
             # Check for confirmed reservation overlap
-            start_date = serializer.validated_data['start_date']
-            end_date = serializer.validated_data['end_date']
-            if ReservationModel.objects.filter(
-                    car=car,
-                    start_date__lte=end_date,
-                    end_date__gte=start_date,
-                    status=ReservationStatusChoices.CONFIRMED
-            ).exists():
+            if car.reserved_in_period:
                 raise serializers.ValidationError(
                     "This car is reserved for that period. Please choose another car or time."
                 )
@@ -68,14 +132,13 @@ class RentalViewSet(viewsets.ModelViewSet):
             day_count = (end_date.date() - start_date.date()).days or 1  # Minimum 1 day
             total_amount = daily_price * day_count
 
-            # Check user balance
-            if user.balance < total_amount:
+            # Deduct balance; the guard on the row makes this the balance check too
+            charged = UserModel.objects.filter(pk=user.pk, balance__gte=total_amount).update(
+                balance=F('balance') - total_amount
+            )
+            if not charged:
                 raise serializers.ValidationError("Insufficient balance.")
 
-            # Deduct balance
-            user.balance = F('balance') - total_amount
-            user.save()
-
             # Save rental
             rental = serializer.save(
                 client=user,
@@ -95,32 +158,15 @@ class RentalViewSet(viewsets.ModelViewSet):
         Handle rental updates with role-based permissions.
         """
         user = self.request.user
-        rental = self.get_object()
+        # Already fetched and permission-checked by update()
+        rental = serializer.instance
 
         if user.role == UserChoice.CLIENT:
             # Clients can only cancel or update their own rentals
             new_status = self.request.data.get('status')
-            if new_status == RentalStatusChoices.CANCELLED and rental.status == RentalStatusChoices.PENDING:
-                with transaction.atomic():
-                    rental.status = RentalStatusChoices.CANCELLED
-                    rental.save()
-
-                    # Refund user
-                    user.balance = F('balance') + rental.total_amount
-                    user.save()
-
-                    # Update vehicle status
-                    rental.car.status = VehicleStatusChoices.AVAILABLE
-                    rental.car.save()
-
-                    # Send email
-                    send_email_notification(
-                        user_id=user.id,
-                        subject="Rental Cancelled",
-                        message=f"Your rental for {rental.car} has been cancelled."
-                    )
-                serializer.instance = rental
-                return Response(RentalSerializer(rental).data, status=status.HTTP_200_OK)
+            if new_status == RentalStatusChoices.CANCELLED:
+                if not self._cancel_pending(rental):
+                    raise serializers.ValidationError("Invalid status transition.")
             else:
                 raise serializers.ValidationError("Invalid status transition.")
         elif user.role == UserChoice.MANAGER:
@@ -129,6 +175,44 @@ class RentalViewSet(viewsets.ModelViewSet):
         else:
             raise serializers.ValidationError("You do not have permission to update this rental.")
 
+    @staticmethod
+    def _cancel_pending(rental):
+        """
+        Cancel a pending rental, refund the client and release the car.
+        Returns False if the rental is no longer pending.
+        """
+        with transaction.atomic():
+            now = timezone.now()
+            # The status guard makes concurrent cancels race on this row, so
+            # only one of them refunds
+            cancelled = RentalModel.objects.filter(
+                pk=rental.pk, status=RentalStatusChoices.PENDING
+            ).update(status=RentalStatusChoices.CANCELLED, updated_at=now)
+            if not cancelled:
+                return False
+
+            # Refund user
+            UserModel.objects.filter(pk=rental.client_id).update(
+                balance=F('balance') + rental.total_amount
+            )
+
+            # Update vehicle status
+            VehicleModel.objects.filter(pk=rental.car_id).update(
+                status=VehicleStatusChoices.AVAILABLE, updated_at=now
+            )
+
+            # Send email
+            send_email_notification(
+                user_id=rental.client_id,
+                subject="Rental Cancelled",
+                message=f"Your rental for {rental.car} has been cancelled."
+            )
+
+        rental.status = RentalStatusChoices.CANCELLED
+        rental.updated_at = now
+        rental.car.status = VehicleStatusChoices.AVAILABLE
+        return True
+
     def destroy(self, request, *args, **kwargs):
         user = request.user
         rental = self.get_object()
@@ -136,51 +220,35 @@ class RentalViewSet(viewsets.ModelViewSet):
         if user.role == UserChoice.MANAGER:
             # Managers can delete rentals
             with transaction.atomic():
+                rental = RentalModel.objects.select_related('car').select_for_update().get(pk=rental.pk)
+
                 # Refund user if rental was active or pending
                 if rental.status in [RentalStatusChoices.PENDING, RentalStatusChoices.ACTIVE]:
-                    rental.client.balance = F('balance') + rental.total_amount
-                    rental.client.save()
+                    UserModel.objects.filter(pk=rental.client_id).update(
+                        balance=F('balance') + rental.total_amount
+                    )
 
                 # Update vehicle status
                 rental.car.status = VehicleStatusChoices.AVAILABLE
-                rental.car.save()
+                rental.car.save(update_fields=['status', 'updated_at'])
 
                 # Delete rental
                 rental.delete()
 
                 # Send email
                 send_email_notification(
-                    user_id=rental.client.id,
+                    user_id=rental.client_id,
                     subject="Rental Deleted",
                     message=f"Your rental for {rental.car} has been deleted by a manager."
                 )
             return Response(status=status.HTTP_204_NO_CONTENT)
         elif user.role == UserChoice.CLIENT:
-            if rental.status == RentalStatusChoices.PENDING:
-                with transaction.atomic():
-                    rental.status = RentalStatusChoices.CANCELLED
-                    rental.save()
-
-                    # Refund user
-                    rental.client.balance = F('balance') + rental.total_amount
-                    rental.client.save()
-
-                    # Update vehicle status
-                    rental.car.status = VehicleStatusChoices.AVAILABLE
-                    rental.car.save()
-
-                    # Send email
-                    send_email_notification(
-                        user_id=rental.client.id,
-                        subject="Rental Cancelled",
-                        message=f"Your rental for {rental.car} has been cancelled."
-                    )
-                return Response(RentalSerializer(rental).data, status=status.HTTP_200_OK)
-            else:
+            if not self._cancel_pending(rental):
                 return Response(
                     {"error": "You can only cancel rentals that are pending."},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+            return Response(RentalSerializer(rental).data, status=status.HTTP_200_OK)
         else:
             return Response({"error": "You do not have permission to delete this rental."},
                             status=status.HTTP_403_FORBIDDEN)
@@ -189,16 +257,7 @@ class RentalViewSet(viewsets.ModelViewSet):
         operation_id="set_rental_status",
         operation_summary="Set rental status",
         operation_description="Allows managers to set the status of a rental.",
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                'status': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    enum=[choice[0] for choice in RentalStatusChoices.choices],
-                    description='New status for the rental'
-                )
-            }
-        ),
+        request_body=_RENTAL_SET_STATUS_SCHEMA,
         responses={
             200: RentalSerializer(),
             400: "Bad Request",
@@ -211,7 +270,7 @@ class RentalViewSet(viewsets.ModelViewSet):
         Manager can forcibly set rental status if allowed transitions.
         """
         with transaction.atomic():
-            rental = RentalModel.objects.select_for_update().get(pk=pk)
+            rental = RentalModel.objects.select_related('car').select_for_update().get(pk=pk)
             new_status = request.data.get('status')
 
             if not rental.can_transition_to(new_status):
@@ -220,6 +279,7 @@ class RentalViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
+            vehicle_status = None
             if new_status == RentalStatusChoices.ACTIVE:
                 # Check for overlapping reservations
                 if ReservationModel.objects.filter(
@@ -232,27 +292,40 @@ class RentalViewSet(viewsets.ModelViewSet):
                         {"error": "This car is already reserved during this period."},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-                rental.car.status = VehicleStatusChoices.RENTED
+                vehicle_status = VehicleStatusChoices.RENTED
             elif new_status == RentalStatusChoices.COMPLETED:
-                if not rental.return_station:
+                if rental.return_station_id is None:
                     return Response(
                         {"error": "Set return_station before completing the rental."},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-                rental.car.status = VehicleStatusChoices.AVAILABLE
+                vehicle_status = VehicleStatusChoices.AVAILABLE
             elif new_status == RentalStatusChoices.CANCELLED:
                 # Refund user if necessary
-                rental.client.balance = F('balance') + rental.total_amount
-                rental.client.save()
-                rental.car.status = VehicleStatusChoices.AVAILABLE
+                UserModel.objects.filter(pk=rental.client_id).update(
+                    balance=F('balance') + rental.total_amount
+                )
+                vehicle_status = VehicleStatusChoices.AVAILABLE
 
             rental.status = new_status
-            rental.save()
-            rental.car.save()
+            try:
+                with transaction.atomic():
+                    rental.save(update_fields=['status', 'updated_at'])
+            except IntegrityError:
+                # one_active_rental_per_client
+                return Response(
+                    {"error": "This client already has an active rental."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Only write the vehicle when the transition changes its status
+            if vehicle_status is not None and rental.car.status != vehicle_status:
+                rental.car.status = vehicle_status
+                rental.car.save(update_fields=['status', 'updated_at'])
 
             # Send email notification
             send_email_notification(
-                user_id=rental.client.id,
+                user_id=rental.client_id,
                 subject="Rental Status Updated",
                 message=f"Your rental for {rental.car} has been updated to {new_status}."
             )
@@ -261,14 +334,7 @@ class RentalViewSet(viewsets.ModelViewSet):
 
     @swagger_auto_schema(
         methods=['post'],
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                'return_station': openapi.Schema(type=openapi.TYPE_INTEGER),
-                'latitude': openapi.Schema(type=openapi.TYPE_NUMBER),
-                'longitude': openapi.Schema(type=openapi.TYPE_NUMBER),
-            }
-        ),
+        request_body=_RETURN_CAR_SCHEMA,
         responses={200: openapi.Schema(type=openapi.TYPE_OBJECT)}
     )
     @action(detail=False, methods=['post'], url_path='return-car-to-station',
@@ -277,18 +343,14 @@ class RentalViewSet(viewsets.ModelViewSet):
         """
         Client returns the car to a station, verifying they are physically near the station.
         """
+        # Only clients get here: IsClient rejects managers' POSTs before
+        # any query runs
         user = request.user
-        if user.role != UserChoice.CLIENT:
-            return Response({"error": "You do not have permission to return a car."},
-                            status=status.HTTP_403_FORBIDDEN)
-
-        try:
-            rental = RentalModel.objects.select_for_update().get(client=user, status=RentalStatusChoices.ACTIVE)
-        except RentalModel.DoesNotExist:
-            return Response({"error": "No active rental found for this user."}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Checks that only depend on the request run before the transaction,
+        # so rejected returns never take the rental lock
         station_id = request.data.get('return_station')
-        station = StationModel.objects.filter(id=station_id).first()
+        station = get_cached_station(station_id)
         if not station:
             return Response({"error": "Station not found."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -297,20 +359,29 @@ class RentalViewSet(viewsets.ModelViewSet):
         if user_lat is None or user_lon is None:
             return Response({"error": "Latitude/longitude is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if not is_near_station(user_lat, user_lon, station.latitude, station.longitude):
+        if not is_near_station(user_lat, user_lon, station=station):
             return Response({"error": "You are not near the station."}, status=status.HTTP_400_BAD_REQUEST)
 
+        # The rental row stays locked from the lookup until it is completed,
+        # so concurrent returns cannot both complete it
         with transaction.atomic():
+            try:
+                rental = RentalModel.objects.select_related('car').select_for_update().get(
+                    client=user, status=RentalStatusChoices.ACTIVE
+                )
+            except RentalModel.DoesNotExist:
+                return Response({"error": "No active rental found for this user."}, status=status.HTTP_400_BAD_REQUEST)
+
             # Mark rental as COMPLETED, set return_station
             rental.status = RentalStatusChoices.COMPLETED
             rental.return_station = station
-            rental.save()
+            rental.save(update_fields=['status', 'return_station', 'updated_at'])
 
             # Update vehicle
             vehicle = rental.car
             vehicle.status = VehicleStatusChoices.AVAILABLE
             vehicle.current_station = station
-            vehicle.save()
+            vehicle.save(update_fields=['status', 'current_station', 'updated_at'])
 
         # Send email notification
         send_email_notification(
@@ -322,14 +393,15 @@ class RentalViewSet(viewsets.ModelViewSet):
         return Response({"message": "Car returned to station successfully."}, status=status.HTTP_200_OK)
 
 
-@method_decorator(gzip_page, name='dispatch')
 class ReservationViewSet(viewsets.ModelViewSet):
     """
     A viewset for viewing and editing reservation instances.
     """
     serializer_class = ReservationSerializer
     permission_classes = [IsReservationOwnerOrManager]
-    queryset = ReservationModel.objects.select_related('car', 'client').all()
+    # Reads render relations from their *_id columns, so nothing is joined
+    queryset = ReservationModel.objects.order_by('-created_at')
+    lookup_value_regex = r'\d+'
     http_method_names = ['get', 'post']
 
     def get_queryset(self):
@@ -337,11 +409,22 @@ class ReservationViewSet(viewsets.ModelViewSet):
         Override the default `get_queryset` to handle filtering based on user role.
         """
         user = self.request.user
-        if user.is_authenticated and user.role == UserChoice.CLIENT:
-            return self.queryset.filter(client=user)
-        elif user.is_authenticated and user.role == UserChoice.MANAGER:
-            return self.queryset.all()
-        return ReservationModel.objects.none()
+        role = user.role if user.is_authenticated else None
+        if role == UserChoice.CLIENT:
+            queryset = self.queryset.filter(client=user)
+        elif role == UserChoice.MANAGER:
+            queryset = self.queryset.all()
+        else:
+            return ReservationModel.objects.none()
+        if self.action == 'list':
+            # Listings are rendered from plain rows
+            return queryset.values(*_RESERVATION_ROW_FIELDS)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in ('list', 'retrieve'):
+            return ReservationReadSerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         """
@@ -353,25 +436,35 @@ class ReservationViewSet(viewsets.ModelViewSet):
             start_date = serializer.validated_data['start_date']
             end_date = serializer.validated_data['end_date']
 
+            # Evaluate both conflict checks in a single query
+            has_own_reservation, is_rented = VehicleModel.objects.filter(pk=car.pk).annotate(
+                has_own_reservation=Exists(
+                    ReservationModel.objects.filter(
+                        client=user,
+                        car=OuterRef('pk'),
+                        status__in=[ReservationStatusChoices.PENDING, ReservationStatusChoices.CONFIRMED],
+                        start_date__lte=end_date,
+                        end_date__gte=start_date
+                    )
+                ),
+                is_rented=Exists(
+                    RentalModel.objects.filter(
+                        car=OuterRef('pk'),
+                        status=RentalStatusChoices.ACTIVE,
+                        start_date__lte=end_date,
+                        end_date__gte=start_date
+                    )
+                ),
+            ).values_list('has_own_reservation', 'is_rented').get()
+
             # Check if the user already has a PENDING or CONFIRMED reservation for the same car
-            if ReservationModel.objects.filter(
-                    client=user,
-                    car=car,
-                    status__in=[ReservationStatusChoices.PENDING, ReservationStatusChoices.CONFIRMED],
-                    start_date__lte=end_date,
-                    end_date__gte=start_date
-            ).exists():
+            if has_own_reservation:
                 raise serializers.ValidationError(
                     "You already have a reservation for this car during the selected period."
                 )
 
             # Check for active rentals that conflict
-            if RentalModel.objects.filter(
-                    car=car,
-                    status=RentalStatusChoices.ACTIVE,
-                    start_date__lte=end_date,
-                    end_date__gte=start_date
-            ).exists():
+            if is_rented:
                 raise serializers.ValidationError(
                     "This car is already rented during the selected period."
                 )
@@ -406,16 +499,7 @@ class ReservationViewSet(viewsets.ModelViewSet):
         operation_id="set_reservation_status",
         operation_summary="Set reservation status",
         operation_description="Allows managers to set the status of a reservation.",
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                'status': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    enum=[choice[0] for choice in ReservationStatusChoices.choices],
-                    description='New status for the reservation'
-                )
-            }
-        ),
+        request_body=_RESERVATION_SET_STATUS_SCHEMA,
         responses={
             200: ReservationSerializer(),
             400: "Bad Request",
@@ -428,12 +512,12 @@ class ReservationViewSet(viewsets.ModelViewSet):
         Manager can set a reservation's status to CONFIRMED, CANCELLED, etc.
         """
         with transaction.atomic():
-            reservation = ReservationModel.objects.select_for_update().get(pk=pk)
+            # The car is joined for the notification text; only the
+            # reservation row is locked
+            reservation = ReservationModel.objects.select_related('car').select_for_update(of=('self',)).get(pk=pk)
             new_status = request.data.get('status')
 
-            # Define valid statuses
-            valid_statuses = [choice[0] for choice in ReservationStatusChoices.choices]
-            if new_status not in valid_statuses:
+            if new_status not in _RESERVATION_STATUSES:
                 return Response({"error": "Invalid status."}, status=status.HTTP_400_BAD_REQUEST)
 
             # Define valid transitions
@@ -450,23 +534,21 @@ class ReservationViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # If confirming, check for overlapping confirmed reservations or active rentals
+            # If confirming, check for overlapping confirmed reservations and
+            # active rentals
             if new_status == ReservationStatusChoices.CONFIRMED:
-                # Check for overlapping confirmed reservations
                 if ReservationModel.objects.filter(
-                        car=reservation.car,
+                        car=reservation.car_id,
                         status=ReservationStatusChoices.CONFIRMED,
                         start_date__lte=reservation.end_date,
                         end_date__gte=reservation.start_date
-                ).exclude(pk=pk).exists():
+                ).exists():
                     return Response(
                         {"error": "Another confirmed reservation overlaps this period."},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-
-                # Check for overlapping active rentals
                 if RentalModel.objects.filter(
-                        car=reservation.car,
+                        car=reservation.car_id,
                         status=RentalStatusChoices.ACTIVE,
                         start_date__lte=reservation.end_date,
                         end_date__gte=reservation.start_date
@@ -478,11 +560,20 @@ class ReservationViewSet(viewsets.ModelViewSet):
 
             # Update reservation status
             reservation.status = new_status
-            reservation.save()
+            try:
+                with transaction.atomic():
+                    reservation.save(update_fields=['status', 'updated_at'])
+            except IntegrityError:
+                # reservation_confirmed_no_overlap, if a concurrent confirmation
+                # committed after the check above
+                return Response(
+                    {"error": "Another confirmed reservation overlaps this period."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
             # Send email notification
             send_email_notification(
-                user_id=reservation.client.id,
+                user_id=reservation.client_id,
                 subject="Reservation Status Updated",
                 message=f"Your reservation for {reservation.car} has been updated to {new_status}."
             )
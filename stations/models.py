@@ -1,4 +1,7 @@
+from math import radians
+
 from django.db import models
+from django.utils.functional import cached_property
 
 class StationModel(models.Model):
     name = models.CharField(max_length=100, unique=True, db_index=True)
@@ -18,3 +21,8 @@ class StationModel(models.Model):
 
     def __str__(self):
         return self.name
+
+    @cached_property
+    def coordinates_rad(self):
+        """(latitude, longitude) in radians, for distance checks."""
+        return radians(float(self.latitude)), radians(float(self.longitude))
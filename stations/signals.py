@@ -0,0 +1,12 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import StationModel
+from .utils import station_cache_key
+
+
+@receiver(post_save, sender=StationModel)
+@receiver(post_delete, sender=StationModel)
+def invalidate_station_cache(sender, instance, **kwargs):
+    cache.delete(station_cache_key(instance.pk))
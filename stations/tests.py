@@ -4,6 +4,7 @@ from rest_framework import status
 from users.models import UserChoice, UserModel
 from .models import StationModel
 from .serializers import StationSerializer
+from .utils import get_cached_station
 from rest_framework_simplejwt.tokens import RefreshToken
 
 class StationTestCase(TestCase):
@@ -103,3 +104,10 @@ class StationTestCase(TestCase):
         self.assertIn("name", serializer.errors)
         self.assertIn("latitude", serializer.errors)
         self.assertIn("longitude", serializer.errors)
+
+    def test_cached_station_invalidated_on_save(self):
+        """Test that updating a station drops its cached copy"""
+        self.assertTrue(get_cached_station(self.station.id).is_active)
+        self.station.is_active = False
+        self.station.save()
+        self.assertFalse(get_cached_station(self.station.id).is_active)
@@ -0,0 +1,31 @@
+from django.core.cache import cache
+
+from .models import StationModel
+
+# Stations change rarely compared to how often rentals look them up, so the
+# rows are cached briefly and dropped from the cache whenever they change.
+STATION_CACHE_TIMEOUT = 60
+
+
+def station_cache_key(pk):
+    return f'station:{pk}'
+
+
+def _load_station(pk):
+    station = StationModel.objects.filter(pk=pk).first()
+    if station is not None:
+        # Computed before caching so the converted coordinates are stored too
+        station.coordinates_rad
+    return station
+
+
+def get_cached_station(pk):
+    """
+    Return the station with the given pk (or None) from the cache, loading it
+    from the database on a miss.
+    """
+    return cache.get_or_set(
+        station_cache_key(pk),
+        lambda: _load_station(pk),
+        STATION_CACHE_TIMEOUT,
+    )
@@ -1,5 +1,3 @@
-from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
@@ -12,7 +10,6 @@ from .models import StationModel
 from .serializers import StationSerializer
 from common.permissions import IsManager, IsAuthenticatedClientOrManager
 
-@method_decorator(gzip_page, name='dispatch')
 class StationViewSet(viewsets.ModelViewSet):
     """
     A viewset for viewing and editing station instances.
@@ -78,7 +75,7 @@ class StationViewSet(viewsets.ModelViewSet):
         if station.is_active:
             return Response({'detail': 'Station is already active.'}, status=status.HTTP_400_BAD_REQUEST)
         station.is_active = True
-        station.save()
+        station.save(update_fields=['is_active', 'updated_at'])
         serializer = self.get_serializer(station)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -104,6 +101,6 @@ class StationViewSet(viewsets.ModelViewSet):
         if not station.is_active:
             return Response({'detail': 'Station is already inactive.'}, status=status.HTTP_400_BAD_REQUEST)
         station.is_active = False
-        station.save()
+        station.save(update_fields=['is_active', 'updated_at'])
         serializer = self.get_serializer(station)
         return Response(serializer.data, status=status.HTTP_200_OK)
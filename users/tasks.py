@@ -66,12 +66,12 @@ def send_email_notifications_task(user_id, subject, message):
     :param message: Email message
     """
     try:
-        user = UserModel.objects.get(id=user_id)
+        email = UserModel.objects.values_list('email', flat=True).get(id=user_id)
         send_mail(
             subject=subject,
             message=message,
             from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
+            recipient_list=[email],
             fail_silently=False,
         )
     except UserModel.DoesNotExist:
@@ -109,7 +109,7 @@ class VerifyView(APIView):
                 return Response({'message': 'Invalid OTP'}, status=status.HTTP_400_BAD_REQUEST)
             user = UserModel.objects.get(id=data['user_id'])
             user.is_verified = True
-            user.save()
+            user.save(update_fields=['is_verified'])
             cache.delete(verification_id)
             return Response({'message': 'User verified successfully'}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -163,7 +163,7 @@ class ChangePasswordView(APIView):
             if not user.check_password(serializer.validated_data['old_password']):
                 return Response({'message': 'Old password is incorrect'}, status=status.HTTP_400_BAD_REQUEST)
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             send_password_change_notification(user.id)
             return Response({'message': 'Password changed successfully'}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -241,7 +241,7 @@ class ResetPasswordConfirmView(APIView):
                 return Response({'message': 'Invalid OTP'}, status=status.HTTP_400_BAD_REQUEST)
             user = UserModel.objects.get(id=data['user_id'])
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             cache.delete(verification_id)
             send_password_reset_notification(user.id)
             return Response({'message': 'Password reset successfully'}, status=status.HTTP_200_OK)
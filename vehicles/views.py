@@ -1,21 +1,13 @@
-from django.utils.decorators import method_decorator
-from django.views.decorators.gzip import gzip_page
 from rest_framework import viewsets, status
-from rest_framework.exceptions import PermissionDenied
-from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.utils.decorators import method_decorator
 
 from users.models import UserChoice
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import F
 from .models import VehicleModel, VehicleStatusChoices
 from .serializers import VehicleSerializer, VehicleAvailabilitySerializer
-from drf_yasg import openapi
 from common.permissions import IsManager, IsAuthenticatedClientOrManager
 
-@method_decorator(gzip_page, name='dispatch')
 class VehicleViewSet(viewsets.ModelViewSet):
     """
     A viewset for viewing and editing vehicle instances.